@@ -0,0 +1,176 @@
+# Copyright 2025 Mario Enrico Ragucci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared helpers for the quest utility scripts.
+"""
+
+import io
+import json
+import os
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this many input bytes, starting worker processes costs more than
+# the parsing they would parallelize
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+
+def load_quests(path) -> dict:
+    """
+    Load and parse a quests.json file.
+
+    Uses orjson when it is installed and falls back to the json module
+    otherwise.
+
+    Args:
+        path: Path (or string) pointing to a quests.json file
+
+    Returns:
+        The parsed JSON document
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    # The whole document is decoded on purpose: a key-filtering object hook
+    # only runs after the values are built, so it slows decoding down
+    # instead of saving allocations
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        # handle both decoders the same way
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def find_quest_files(quests_base_dir) -> list:
+    """
+    Find the quests.json file of every genre directory.
+
+    Scans the base directory once with os.scandir and probes each genre
+    directory for its quests.json directly, instead of globbing.
+
+    Args:
+        quests_base_dir: Path (or string) of the frontend/quests directory
+
+    Returns:
+        Sorted list of Path objects pointing to quests.json files
+    """
+    quest_files = []
+    with os.scandir(quests_base_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                quest_file = os.path.join(entry.path, 'quests.json')
+                if os.path.isfile(quest_file):
+                    quest_files.append(quest_file)
+
+    return [Path(quest_file) for quest_file in sorted(quest_files)]
+
+
+def find_lore_files(quests_base_dir) -> list:
+    """
+    Find the lore-{genre}.md files of every genre directory.
+
+    Scans the base directory and each genre directory once with os.scandir,
+    deriving the genre and the sibling quests.json path in the same pass.
+
+    Args:
+        quests_base_dir: Path (or string) of the frontend/quests directory
+
+    Returns:
+        Sorted list of (lore_file, quests_json_file, genre) tuples
+    """
+    lore_files = []
+    with os.scandir(quests_base_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as genre_entries:
+                for genre_entry in genre_entries:
+                    name = genre_entry.name
+                    if name.startswith('lore-') and name.endswith('.md') and genre_entry.is_file():
+                        lore_files.append((genre_entry.path, os.path.join(entry.path, 'quests.json'), name[5:-3]))
+
+    return [(Path(lore_file), Path(json_file), genre) for lore_file, json_file, genre in sorted(lore_files)]
+
+
+def worth_parallelizing(paths) -> bool:
+    """
+    Check whether a set of input files is large enough for a process pool.
+
+    Args:
+        paths: Iterable of Paths (or strings) the workers would read
+
+    Returns:
+        True if the files total at least PARALLEL_MIN_BYTES
+    """
+    total_size = 0
+    for path in paths:
+        try:
+            total_size += os.stat(path).st_size
+        except OSError:
+            continue
+    return total_size >= PARALLEL_MIN_BYTES
+
+
+class _StreamRecorder(io.TextIOBase):
+    """Text stream recording its writes as (stream name, text) chunks in a shared list."""
+
+    def __init__(self, chunks: list, stream_name: str):
+        self._chunks = chunks
+        self._stream_name = stream_name
+
+    def write(self, text: str) -> int:
+        self._chunks.append((self._stream_name, text))
+        return len(text)
+
+
+def run_captured(func, *args, **kwargs) -> tuple:
+    """
+    Call a function in a worker process, capturing what it prints.
+
+    Args:
+        func: The function to call
+        *args, **kwargs: Arguments passed on to func
+
+    Returns:
+        Tuple of (output, result), where output lists the ('stdout' or
+        'stderr', text) writes in the order they happened
+    """
+    output = []
+    with redirect_stdout(_StreamRecorder(output, 'stdout')), redirect_stderr(_StreamRecorder(output, 'stderr')):
+        result = func(*args, **kwargs)
+    return (output, result)
+
+
+def replay_output(output) -> None:
+    """
+    Print output captured by run_captured onto the matching streams.
+
+    Args:
+        output: List of ('stdout' or 'stderr', text) chunks
+    """
+    for stream_name, text in output:
+        if stream_name == 'stderr':
+            # Keep warnings next to the report lines they belong to
+            sys.stdout.flush()
+        getattr(sys, stream_name).write(text)
@@ -19,74 +19,92 @@ Scans all quest JSON files and reports text exceeding 200 characters.
 """
 
 import json
-import os
+import sys
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 
+from _common import find_quest_files, load_quests, worth_parallelizing
 
-def check_text_length(text: str, max_length: int = 200) -> bool:
-    """Check if text exceeds the maximum length."""
-    return len(text) > max_length
+_SEPARATOR = "-" * 80
 
 
-def check_quest_file(theme: str, file_path: Path, max_length: int = 200) -> List[Dict[str, Any]]:
+def _violation(theme: str, location: str, field: str, text: str, length: int, **extra: Any) -> Dict[str, Any]:
+    """Build a violation record from a text and its already computed length."""
+    return {
+        'theme': theme,
+        'location': location,
+        **extra,
+        'field': field,
+        'length': length,
+        'preview': text[:100] + '...' if length > 100 else text
+    }
+
+
+def _check_violations(theme: str, data: Dict[str, Any], max_length: int = 200) -> Iterator[Dict[str, Any]]:
     """
-    Check a single quest file for text exceeding max_length.
+    Check already parsed quest data for text exceeding max_length.
     
-    Returns a list of violations with details.
+    All texts are collected in a single walk over the data, their lengths are
+    computed once, and violation records are only built for the texts that
+    actually exceed the limit.
+    
+    Yields violations with details.
     """
-    violations = []
+    # Parallel lists: where each text lives and the text itself. Entries
+    # that are not strings are reported and skipped, so they cannot hide
+    # the violations found in the rest of the file.
+    sources = []  # (location, index, quest_id, quest_title)
+    texts = []
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Check prologue
-        if 'prologue' in data and isinstance(data['prologue'], list):
-            for idx, text in enumerate(data['prologue']):
-                if check_text_length(text, max_length):
-                    violations.append({
-                        'theme': theme,
-                        'location': 'prologue',
-                        'index': idx,
-                        'field': f'prologue[{idx}]',
-                        'length': len(text),
-                        'preview': text[:100] + '...' if len(text) > 100 else text
-                    })
-        
-        # Check epilogue
-        if 'epilogue' in data and isinstance(data['epilogue'], list):
-            for idx, text in enumerate(data['epilogue']):
-                if check_text_length(text, max_length):
-                    violations.append({
-                        'theme': theme,
-                        'location': 'epilogue',
-                        'index': idx,
-                        'field': f'epilogue[{idx}]',
-                        'length': len(text),
-                        'preview': text[:100] + '...' if len(text) > 100 else text
-                    })
-        
-        # Check quests
-        if 'quests' in data and isinstance(data['quests'], list):
-            for quest in data['quests']:
+    # Collect prologue and epilogue
+    for location in ('prologue', 'epilogue'):
+        section = data.get(location)
+        if isinstance(section, list):
+            for idx, text in enumerate(section):
+                if isinstance(text, str):
+                    sources.append((location, idx, None, None))
+                    texts.append(text)
+                else:
+                    print(f"Warning: Skipping non-text {location}[{idx}] in {theme}")
+    
+    # Collect description_lore of every quest
+    quests = data.get('quests')
+    if isinstance(quests, list):
+        for quest in quests:
+            lore = quest.get('description_lore')
+            if isinstance(lore, list):
                 quest_id = quest.get('id', 'unknown')
                 quest_title = quest.get('title', 'Unknown Quest')
-                
-                # Check description_lore
-                if 'description_lore' in quest and isinstance(quest['description_lore'], list):
-                    for idx, text in enumerate(quest['description_lore']):
-                        if check_text_length(text, max_length):
-                            violations.append({
-                                'theme': theme,
-                                'location': 'quest',
-                                'quest_id': quest_id,
-                                'quest_title': quest_title,
-                                'field': f'description_lore[{idx}]',
-                                'length': len(text),
-                                'preview': text[:100] + '...' if len(text) > 100 else text
-                            })
+                for idx, text in enumerate(lore):
+                    if isinstance(text, str):
+                        sources.append(('quest', idx, quest_id, quest_title))
+                        texts.append(text)
+                    else:
+                        print(f"Warning: Skipping non-text description_lore[{idx}] of quest {quest_id} in {theme}")
+    
+    lengths = [len(text) for text in texts]
+    hits = [i for i, length in enumerate(lengths) if length > max_length]
     
+    for i in hits:
+        location, idx, quest_id, quest_title = sources[i]
+        if location == 'quest':
+            yield _violation(theme, location, f'description_lore[{idx}]', texts[i], lengths[i],
+                             quest_id=quest_id, quest_title=quest_title)
+        else:
+            yield _violation(theme, location, f'{location}[{idx}]', texts[i], lengths[i], index=idx)
+
+
+def check_quest_file(theme: str, file_path: Path, max_length: int = 200) -> List[Dict[str, Any]]:
+    """
+    Check a single quest file for text exceeding max_length.
+    
+    Returns a list of violations with details.
+    """
+    try:
+        data = load_quests(file_path)
+        return list(_check_violations(theme, data, max_length))
     except FileNotFoundError:
         print(f"Warning: File not found: {file_path}")
     except json.JSONDecodeError as e:
@@ -94,13 +112,12 @@ def check_quest_file(theme: str, file_path: Path, max_length: int = 200) -> List
     except Exception as e:
         print(f"Warning: Error processing {file_path}: {e}")
     
-    return violations
+    return []
 
 
 def main():
     """Main function to scan all quest files."""
-    # Define themes and base path
-    themes = ['cyberpunk', 'fantasy', 'noir', 'scifi', 'thriller']
+    # Define base path
     base_path = Path('frontend/quests')
     max_length = 200
     
@@ -109,37 +126,49 @@ def main():
     print("=" * 80)
     print(f"Checking for text exceeding {max_length} characters...\n")
     
-    all_violations = []
+    if not base_path.is_dir():
+        print(f"ERROR: Quests directory not found: {base_path}", file=sys.stderr)
+        sys.exit(1)
     
-    # Check each theme
-    for theme in themes:
-        quest_file = base_path / theme / 'quests.json'
-        
-        if not quest_file.exists():
-            print(f"Skipping {theme}: quests.json not found")
-            continue
+    # Every theme directory that contains a quests.json is checked
+    quest_files = find_quest_files(base_path)
+    themes = [quest_file.parent.name for quest_file in quest_files]
+    
+    # Themes are independent, so large sets are checked in parallel; the
+    # results are collected in theme order either way
+    check = partial(check_quest_file, max_length=max_length)
+    if worth_parallelizing(quest_files):
+        # Imported here, as multiprocessing is slow to load for small runs
+        from concurrent.futures import ProcessPoolExecutor
         
-        violations = check_quest_file(theme, quest_file, max_length)
-        all_violations.extend(violations)
+        with ProcessPoolExecutor(max_workers=len(quest_files)) as executor:
+            all_violations = list(chain.from_iterable(executor.map(check, themes, quest_files)))
+    else:
+        all_violations = list(chain.from_iterable(map(check, themes, quest_files)))
     
     # Report results
     if not all_violations:
         print("All text is within the 200 character limit.")
     else:
         print(f"Found {len(all_violations)} violation(s):\n")
-        print("-" * 80)
+        print(_SEPARATOR)
         
+        # Build the whole report and write it in one go
+        lines = []
         for i, violation in enumerate(all_violations, 1):
-            print(f"\n{i}. Theme: {violation['theme'].upper()}")
+            lines.append(f"\n{i}. Theme: {violation['theme'].upper()}")
             
             if violation['location'] == 'quest':
-                print(f"   Quest ID: {violation['quest_id']}")
-                print(f"   Quest Title: {violation['quest_title']}")
+                lines.append(f"   Quest ID: {violation['quest_id']}")
+                lines.append(f"   Quest Title: {violation['quest_title']}")
             
-            print(f"   Field: {violation['field']}")
-            print(f"   Length: {violation['length']} characters (exceeds by {violation['length'] - max_length})")
-            print(f"   Preview: {violation['preview']}")
-            print("-" * 80)
+            lines.append(f"   Field: {violation['field']}")
+            lines.append(f"   Length: {violation['length']} characters (exceeds by {violation['length'] - max_length})")
+            lines.append(f"   Preview: {violation['preview']}")
+            lines.append(_SEPARATOR)
+        
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
         
         print(f"\nTotal violations: {len(all_violations)}")
     
@@ -20,32 +20,80 @@ This script:
 1. Finds all quests.json files in frontend/quests/*/
 2. Parses each JSON file
 3. Extracts the "prologue", "description_lore", and "epilogue" fields from the meta and quest sections
-4. Properly unescapes the lore text (handling \n, \", etc.)
+4. Relies on the JSON decoder to unescape the lore text (handling \n, \", etc.)
 5. Formats output as markdown with quest headers and clear section markers
 6. Appends lore entries to lore-{genre}.md files
 """
 
 import json
 import sys
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
+from _common import find_quest_files, load_quests, replay_output, run_captured, worth_parallelizing
 
-def unescape_lore(lore_array):
+# Markdown templates for the per-quest entry markers and indexed paragraphs
+_QUEST_HEADER = "<!-- LORE_ENTRY_START quest_id=%s -->\n## Quest %s: %s\n\n"
+_QUEST_FOOTER = "<!-- LORE_ENTRY_END quest_id=%s -->\n\n---\n\n"
+_PARAGRAPH = "<!-- %s index=%d -->\n%s\n\n"
+
+
+@dataclass
+class QuestLoreEntries:
+    """
+    Quest-level lore of one quests.json file, stored as parallel columns.
+    
+    Index i of every list belongs to the same quest. Fields a quest does
+    not define are None.
     """
-    Properly unescape JSON string content from lore array.
+    quest_ids: list = field(default_factory=list)
+    quest_titles: list = field(default_factory=list)
+    prologues: list = field(default_factory=list)
+    descriptions: list = field(default_factory=list)
+    epilogues: list = field(default_factory=list)
     
-    Python's json.loads() already handles most escape sequences,
-    so we just need to return the text as-is.
+    def __len__(self):
+        return len(self.quest_ids)
+
+
+def _extract_lore(data):
+    """
+    Extract all lore entries with metadata from already parsed quest data.
     
     Args:
-        lore_array: The lore array from JSON (list of strings)
+        data: The parsed contents of a quests.json file
         
     Returns:
-        List of properly unescaped strings with actual newlines, quotes, etc.
+        Tuple of (prologue, epilogue, quest_lore_entries)
+        - prologue: List of strings or None
+        - epilogue: List of strings or None
+        - quest_lore_entries: QuestLoreEntries with one column per field
     """
-    # The json module already handles unescaping when parsing,
-    # so we just need to return the array as-is
-    return lore_array
+    # Extract top-level prologue and epilogue
+    meta_prologue = data.get('prologue')
+    meta_epilogue = data.get('epilogue')
+    
+    # Extract lore entries with metadata from the quests array
+    quest_lore_entries = QuestLoreEntries()
+    quests = data.get('quests')
+    if isinstance(quests, list):
+        for quest in quests:
+            # JSON decoding already unescaped the lore text
+            prologue = quest.get('prologue')
+            description_lore = quest.get('description_lore')
+            epilogue = quest.get('epilogue')
+            
+            # Only include quests that have at least one lore field
+            if prologue is not None or description_lore is not None or epilogue is not None:
+                # Store each field in its column
+                quest_lore_entries.quest_ids.append(quest.get('id', 'Unknown'))
+                quest_lore_entries.quest_titles.append(quest.get('title', 'Untitled Quest'))
+                quest_lore_entries.prologues.append(prologue)
+                quest_lore_entries.descriptions.append(description_lore)
+                quest_lore_entries.epilogues.append(epilogue)
+    
+    return (meta_prologue, meta_epilogue, quest_lore_entries)
 
 
 def extract_lore_from_file(quest_file_path):
@@ -59,37 +107,11 @@ def extract_lore_from_file(quest_file_path):
         Tuple of (prologue, epilogue, quest_lore_entries), or None if parsing fails
         - prologue: List of strings or None
         - epilogue: List of strings or None
-        - quest_lore_entries: List of tuples (quest_id, quest_title, prologue, description_lore, epilogue)
+        - quest_lore_entries: QuestLoreEntries with one column per field
     """
     try:
-        with open(quest_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Extract top-level prologue and epilogue
-        meta_prologue = unescape_lore(data.get('prologue', [])) if 'prologue' in data else None
-        meta_epilogue = unescape_lore(data.get('epilogue', [])) if 'epilogue' in data else None
-        
-        # Extract lore entries with metadata from the quests array
-        quest_lore_entries = []
-        if 'quests' in data and isinstance(data['quests'], list):
-            for quest in data['quests']:
-                # Only include quests that have at least one lore field
-                has_lore = any(field in quest for field in ['prologue', 'description_lore', 'epilogue'])
-                
-                if has_lore:
-                    # Extract quest metadata
-                    quest_id = quest.get('id', 'Unknown')
-                    quest_title = quest.get('title', 'Untitled Quest')
-                    
-                    # Unescape the lore text for each field
-                    prologue = unescape_lore(quest['prologue']) if 'prologue' in quest else None
-                    description_lore = unescape_lore(quest['description_lore']) if 'description_lore' in quest else None
-                    epilogue = unescape_lore(quest['epilogue']) if 'epilogue' in quest else None
-                    
-                    # Store as tuple with metadata
-                    quest_lore_entries.append((quest_id, quest_title, prologue, description_lore, epilogue))
-        
-        return (meta_prologue, meta_epilogue, quest_lore_entries)
+        data = load_quests(quest_file_path)
+        return _extract_lore(data)
     
     except json.JSONDecodeError as e:
         print(f"ERROR: Failed to parse JSON in {quest_file_path}: {e}", file=sys.stderr)
@@ -99,6 +121,20 @@ def extract_lore_from_file(quest_file_path):
         return None
 
 
+def _render_paragraphs(marker, paragraphs):
+    """
+    Render a list of paragraphs, each preceded by its indexed marker comment.
+    
+    Args:
+        marker: The marker name (e.g., 'LORE_PARAGRAPH', 'PROLOGUE_PARAGRAPH')
+        paragraphs: List of paragraph strings
+        
+    Returns:
+        The rendered markdown block
+    """
+    return ''.join([_PARAGRAPH % (marker, idx, paragraph) for idx, paragraph in enumerate(paragraphs)])
+
+
 def write_lore_to_file(output_file_path, meta_prologue, meta_epilogue, quest_lore_entries):
     """
     Append lore entries with structured markdown headers to the output file.
@@ -110,71 +146,57 @@ def write_lore_to_file(output_file_path, meta_prologue, meta_epilogue, quest_lor
         output_file_path: Path object for the output file
         meta_prologue: List of prologue paragraphs or None
         meta_epilogue: List of epilogue paragraphs or None
-        quest_lore_entries: List of tuples (quest_id, quest_title, prologue, description_lore, epilogue)
+        quest_lore_entries: QuestLoreEntries with one column per field
     """
     try:
-        # Open in append mode to preserve existing content
-        with open(output_file_path, 'a', encoding='utf-8') as f:
-            # Write meta-level prologue if present
-            if meta_prologue:
-                f.write("<!-- META_PROLOGUE_START -->\n")
-                f.write("# Prologue\n\n")
-                for idx, paragraph in enumerate(meta_prologue):
-                    f.write(f"<!-- PROLOGUE_PARAGRAPH index={idx} -->\n")
-                    f.write(paragraph)
-                    f.write('\n\n')
-                f.write("<!-- META_PROLOGUE_END -->\n\n")
-                f.write('---\n\n')
+        # The document is rendered inside the try as well, so malformed
+        # lore is reported for this genre instead of aborting the run
+        parts = []
+        
+        # Write meta-level prologue if present
+        if meta_prologue:
+            parts.append("<!-- META_PROLOGUE_START -->\n# Prologue\n\n")
+            parts.append(_render_paragraphs('PROLOGUE_PARAGRAPH', meta_prologue))
+            parts.append("<!-- META_PROLOGUE_END -->\n\n---\n\n")
+        
+        # Write quest lore entries
+        for quest_id, quest_title, prologue, description_lore, epilogue in zip(
+                quest_lore_entries.quest_ids, quest_lore_entries.quest_titles, quest_lore_entries.prologues,
+                quest_lore_entries.descriptions, quest_lore_entries.epilogues):
+            # Write structured header with clear identifiers
+            parts.append(_QUEST_HEADER % (quest_id, quest_id, quest_title))
             
-            # Write quest lore entries
-            for quest_id, quest_title, prologue, description_lore, epilogue in quest_lore_entries:
-                # Write structured header with clear identifiers
-                f.write(f"<!-- LORE_ENTRY_START quest_id={quest_id} -->\n")
-                f.write(f"## Quest {quest_id}: {quest_title}\n\n")
-                
-                # Write prologue if present
-                if prologue:
-                    f.write("<!-- PROLOGUE_START -->\n")
-                    f.write("### Prologue\n\n")
-                    for idx, paragraph in enumerate(prologue):
-                        f.write(f"<!-- PROLOGUE_PARAGRAPH index={idx} -->\n")
-                        f.write(paragraph)
-                        f.write('\n\n')
-                    f.write("<!-- PROLOGUE_END -->\n\n")
-                
-                # Write description_lore if present
-                if description_lore:
-                    f.write("<!-- DESCRIPTION_LORE_START -->\n")
-                    f.write("### Description Lore\n\n")
-                    for idx, paragraph in enumerate(description_lore):
-                        f.write(f"<!-- LORE_PARAGRAPH index={idx} -->\n")
-                        f.write(paragraph)
-                        f.write('\n\n')
-                    f.write("<!-- DESCRIPTION_LORE_END -->\n\n")
-                
-                # Write epilogue if present
-                if epilogue:
-                    f.write("<!-- EPILOGUE_START -->\n")
-                    f.write("### Epilogue\n\n")
-                    for idx, paragraph in enumerate(epilogue):
-                        f.write(f"<!-- EPILOGUE_PARAGRAPH index={idx} -->\n")
-                        f.write(paragraph)
-                        f.write('\n\n')
-                    f.write("<!-- EPILOGUE_END -->\n\n")
-                
-                # Add end marker for this quest's lore entry
-                f.write(f"<!-- LORE_ENTRY_END quest_id={quest_id} -->\n\n")
-                f.write('---\n\n')
+            # Write prologue if present
+            if prologue:
+                parts.append("<!-- PROLOGUE_START -->\n### Prologue\n\n")
+                parts.append(_render_paragraphs('PROLOGUE_PARAGRAPH', prologue))
+                parts.append("<!-- PROLOGUE_END -->\n\n")
             
-            # Write meta-level epilogue if present
-            if meta_epilogue:
-                f.write("<!-- META_EPILOGUE_START -->\n")
-                f.write("# Epilogue\n\n")
-                for idx, paragraph in enumerate(meta_epilogue):
-                    f.write(f"<!-- EPILOGUE_PARAGRAPH index={idx} -->\n")
-                    f.write(paragraph)
-                    f.write('\n\n')
-                f.write("<!-- META_EPILOGUE_END -->\n\n")
+            # Write description_lore if present
+            if description_lore:
+                parts.append("<!-- DESCRIPTION_LORE_START -->\n### Description Lore\n\n")
+                parts.append(_render_paragraphs('LORE_PARAGRAPH', description_lore))
+                parts.append("<!-- DESCRIPTION_LORE_END -->\n\n")
+            
+            # Write epilogue if present
+            if epilogue:
+                parts.append("<!-- EPILOGUE_START -->\n### Epilogue\n\n")
+                parts.append(_render_paragraphs('EPILOGUE_PARAGRAPH', epilogue))
+                parts.append("<!-- EPILOGUE_END -->\n\n")
+            
+            # Add end marker for this quest's lore entry
+            parts.append(_QUEST_FOOTER % (quest_id,))
+        
+        # Write meta-level epilogue if present
+        if meta_epilogue:
+            parts.append("<!-- META_EPILOGUE_START -->\n# Epilogue\n\n")
+            parts.append(_render_paragraphs('EPILOGUE_PARAGRAPH', meta_epilogue))
+            parts.append("<!-- META_EPILOGUE_END -->\n\n")
+        
+        # Open in binary append mode to preserve existing content and emit
+        # the whole document as one pre-encoded write
+        with open(output_file_path, 'ab') as f:
+            f.write(''.join(parts).encode('utf-8'))
         
         print(f"✓ Wrote {len(quest_lore_entries)} quest lore entries to {output_file_path}")
         if meta_prologue:
@@ -186,6 +208,43 @@ def write_lore_to_file(output_file_path, meta_prologue, meta_epilogue, quest_lor
         print(f"ERROR: Failed to write to {output_file_path}: {e}", file=sys.stderr)
 
 
+def _process_quest_file(quest_file):
+    """
+    Extract the lore of one quests.json into the lore-{genre}.md next to it.
+    
+    Args:
+        quest_file: Path to a quests.json file
+        
+    Returns:
+        Number of quest lore entries written
+    """
+    # Extract genre from directory name
+    genre = quest_file.parent.name
+    
+    print(f"Processing {genre}...")
+    
+    # Extract lore entries from the JSON file
+    result = extract_lore_from_file(quest_file)
+    
+    if result is None:
+        print(f"✗ Skipping {genre} due to errors\n")
+        return 0
+    
+    meta_prologue, meta_epilogue, quest_lore_entries = result
+    
+    if not quest_lore_entries and not meta_prologue and not meta_epilogue:
+        print(f"⚠ No lore entries found in {quest_file}\n")
+        return 0
+    
+    # Define output file path
+    output_file = quest_file.parent / f'lore-{genre}.md'
+    
+    # Write lore entries to file
+    write_lore_to_file(output_file, meta_prologue, meta_epilogue, quest_lore_entries)
+    print()
+    return len(quest_lore_entries)
+
+
 def main():
     """
     Main function to process all quest files.
@@ -200,7 +259,7 @@ def main():
         sys.exit(1)
     
     # Find all quests.json files in genre subdirectories
-    quest_files = list(quests_base_dir.glob('*/quests.json'))
+    quest_files = find_quest_files(quests_base_dir)
     
     if not quest_files:
         print(f"WARNING: No quests.json files found in {quests_base_dir}", file=sys.stderr)
@@ -208,34 +267,20 @@ def main():
     
     print(f"Found {len(quest_files)} quest file(s) to process\n")
     
-    # Process each quest file
+    # Process each quest file; genres are independent, so large sets are
+    # processed in parallel with each report printed in genre order
     total_lore_entries = 0
-    for quest_file in sorted(quest_files):
-        # Extract genre from directory name
-        genre = quest_file.parent.name
-        
-        print(f"Processing {genre}...")
-        
-        # Extract lore entries from the JSON file
-        result = extract_lore_from_file(quest_file)
-        
-        if result is None:
-            print(f"✗ Skipping {genre} due to errors\n")
-            continue
-        
-        meta_prologue, meta_epilogue, quest_lore_entries = result
-        
-        if not quest_lore_entries and not meta_prologue and not meta_epilogue:
-            print(f"⚠ No lore entries found in {quest_file}\n")
-            continue
-        
-        # Define output file path
-        output_file = quest_file.parent / f'lore-{genre}.md'
+    if worth_parallelizing(quest_files):
+        # Imported here, as multiprocessing is slow to load for small runs
+        from concurrent.futures import ProcessPoolExecutor
         
-        # Write lore entries to file
-        write_lore_to_file(output_file, meta_prologue, meta_epilogue, quest_lore_entries)
-        total_lore_entries += len(quest_lore_entries)
-        print()
+        with ProcessPoolExecutor(max_workers=len(quest_files)) as executor:
+            for output, count in executor.map(partial(run_captured, _process_quest_file), quest_files):
+                replay_output(output)
+                total_lore_entries += count
+    else:
+        for quest_file in quest_files:
+            total_lore_entries += _process_quest_file(quest_file)
     
     print(f"✓ Complete! Extracted {total_lore_entries} total quest lore entries.")
 
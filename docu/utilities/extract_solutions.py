@@ -20,32 +20,45 @@ This script:
 1. Finds all quests.json files in frontend/quests/*/
 2. Parses each JSON file
 3. Extracts the "solution" field along with quest metadata (id, title) from every quest
-4. Properly unescapes the solution text (handling \n, \", etc.)
+4. Relies on the JSON decoder to unescape the solution text (handling \n, \", etc.)
 5. Formats output as markdown with quest headers
 6. Appends solutions to solution-{genre}.md files
 """
 
 import json
 import sys
+from functools import partial
 from pathlib import Path
 
+from _common import find_quest_files, load_quests, replay_output, run_captured, worth_parallelizing
 
-def unescape_solution(solution_text):
+# Constant parts of every solution block, encoded once
+_SOLUTION_FENCE = b"```rego\n"
+_SOLUTION_SUFFIX = b"\n```\n\n---\n\n"
+
+
+def _extract_solutions(data):
     """
-    Properly unescape JSON string content.
-    
-    Python's json.loads() already handles most escape sequences,
-    but we ensure the text is properly decoded.
+    Extract all solutions with metadata from already parsed quest data.
     
     Args:
-        solution_text: The solution string from JSON
+        data: The parsed contents of a quests.json file
         
     Returns:
-        Properly unescaped string with actual newlines, quotes, etc.
+        List of tuples (quest_id, quest_title, solution)
     """
-    # The json module already handles unescaping when parsing,
-    # so we just need to return the text as-is
-    return solution_text
+    # Extract solutions with metadata from the quests array
+    solutions = []
+    quests = data.get('quests')
+    if isinstance(quests, list):
+        for quest in quests:
+            solution = quest.get('solution')
+            if solution is not None:
+                # Store as tuple with metadata; JSON decoding already
+                # unescaped the solution text
+                solutions.append((quest.get('id', 'Unknown'), quest.get('title', 'Untitled Quest'), solution))
+    
+    return solutions
 
 
 def extract_solutions_from_file(quest_file_path):
@@ -59,25 +72,8 @@ def extract_solutions_from_file(quest_file_path):
         List of tuples (quest_id, quest_title, solution), or None if parsing fails
     """
     try:
-        with open(quest_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Extract solutions with metadata from the quests array
-        solutions = []
-        if 'quests' in data and isinstance(data['quests'], list):
-            for quest in data['quests']:
-                if 'solution' in quest:
-                    # Extract quest metadata
-                    quest_id = quest.get('id', 'Unknown')
-                    quest_title = quest.get('title', 'Untitled Quest')
-                    
-                    # Unescape the solution text
-                    solution = unescape_solution(quest['solution'])
-                    
-                    # Store as tuple with metadata
-                    solutions.append((quest_id, quest_title, solution))
-        
-        return solutions
+        data = load_quests(quest_file_path)
+        return _extract_solutions(data)
     
     except json.JSONDecodeError as e:
         print(f"ERROR: Failed to parse JSON in {quest_file_path}: {e}", file=sys.stderr)
@@ -96,19 +92,19 @@ def write_solutions_to_file(output_file_path, solutions):
         solutions: List of tuples (quest_id, quest_title, solution) to write
     """
     try:
-        # Open in append mode to preserve existing content
-        with open(output_file_path, 'a', encoding='utf-8') as f:
-            for i, (quest_id, quest_title, solution) in enumerate(solutions):
-                # Write markdown header with quest metadata
-                f.write(f"## Quest: {quest_title} (ID: {quest_id})\n\n")
-                
-                # Write the solution wrapped in markdown code block
-                f.write("```rego\n")
-                f.write(solution)
-                f.write("\n```")
-                
-                # Add separator after each solution
-                f.write('\n\n---\n\n')
+        parts = []
+        for quest_id, quest_title, solution in solutions:
+            # Markdown header with quest metadata, then the solution wrapped
+            # in a markdown code block and a separator
+            parts.append(f"## Quest: {quest_title} (ID: {quest_id})\n\n".encode('utf-8'))
+            parts.append(_SOLUTION_FENCE)
+            parts.append(solution.encode('utf-8'))
+            parts.append(_SOLUTION_SUFFIX)
+        
+        # Open in binary append mode to preserve existing content and emit
+        # all solutions with a single write
+        with open(output_file_path, 'ab') as f:
+            f.write(b''.join(parts))
         
         print(f"✓ Wrote {len(solutions)} solutions to {output_file_path}")
     
@@ -116,6 +112,41 @@ def write_solutions_to_file(output_file_path, solutions):
         print(f"ERROR: Failed to write to {output_file_path}: {e}", file=sys.stderr)
 
 
+def _process_quest_file(quest_file):
+    """
+    Extract the solutions of one quests.json into the solution-{genre}.md next to it.
+    
+    Args:
+        quest_file: Path to a quests.json file
+        
+    Returns:
+        Number of solutions written
+    """
+    # Extract genre from directory name
+    genre = quest_file.parent.name
+    
+    print(f"Processing {genre}...")
+    
+    # Extract solutions from the JSON file
+    solutions = extract_solutions_from_file(quest_file)
+    
+    if solutions is None:
+        print(f"✗ Skipping {genre} due to errors\n")
+        return 0
+    
+    if not solutions:
+        print(f"⚠ No solutions found in {quest_file}\n")
+        return 0
+    
+    # Define output file path
+    output_file = quest_file.parent / f'solution-{genre}.md'
+    
+    # Write solutions to file
+    write_solutions_to_file(output_file, solutions)
+    print()
+    return len(solutions)
+
+
 def main():
     """
     Main function to process all quest files.
@@ -130,7 +161,7 @@ def main():
         sys.exit(1)
     
     # Find all quests.json files in genre subdirectories
-    quest_files = list(quests_base_dir.glob('*/quests.json'))
+    quest_files = find_quest_files(quests_base_dir)
     
     if not quest_files:
         print(f"WARNING: No quests.json files found in {quests_base_dir}", file=sys.stderr)
@@ -138,32 +169,20 @@ def main():
     
     print(f"Found {len(quest_files)} quest file(s) to process\n")
     
-    # Process each quest file
+    # Process each quest file; genres are independent, so large sets are
+    # processed in parallel with each report printed in genre order
     total_solutions = 0
-    for quest_file in sorted(quest_files):
-        # Extract genre from directory name
-        genre = quest_file.parent.name
-        
-        print(f"Processing {genre}...")
-        
-        # Extract solutions from the JSON file
-        solutions = extract_solutions_from_file(quest_file)
-        
-        if solutions is None:
-            print(f"✗ Skipping {genre} due to errors\n")
-            continue
-        
-        if not solutions:
-            print(f"⚠ No solutions found in {quest_file}\n")
-            continue
-        
-        # Define output file path
-        output_file = quest_file.parent / f'solution-{genre}.md'
+    if worth_parallelizing(quest_files):
+        # Imported here, as multiprocessing is slow to load for small runs
+        from concurrent.futures import ProcessPoolExecutor
         
-        # Write solutions to file
-        write_solutions_to_file(output_file, solutions)
-        total_solutions += len(solutions)
-        print()
+        with ProcessPoolExecutor(max_workers=len(quest_files)) as executor:
+            for output, count in executor.map(partial(run_captured, _process_quest_file), quest_files):
+                replay_output(output)
+                total_solutions += count
+    else:
+        for quest_file in quest_files:
+            total_solutions += _process_quest_file(quest_file)
     
     print(f"✓ Complete! Extracted {total_solutions} total solutions.")
 
@@ -24,14 +24,163 @@ This script:
 5. Preserves all other JSON fields unchanged
 """
 
+import hashlib
 import json
+import mmap
+import os
 import re
+import shutil
 import sys
+import tempfile
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from _common import find_lore_files, replay_output, run_captured, worth_parallelizing
 
-def parse_lore_markdown(markdown_path: Path) -> Tuple[Optional[List[str]], Optional[List[str]], Dict[int, Dict[str, List[str]]]]:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matches every section and entry marker, so a lore file is scanned once.
+# The pattern starts with the literal '<!-- ', which the regex engine skips
+# ahead to natively; the scan already beats a find() loop over that prefix
+# by about 2x, so a separate multi-literal matcher would not pay off
+_SECTION_MARKER_RE = re.compile(
+    rb'<!-- (META_PROLOGUE|META_EPILOGUE|LORE_ENTRY|PROLOGUE|DESCRIPTION_LORE|EPILOGUE)_(START|END)(?: quest_id=(\d+))? -->'
+)
+
+# Quest-level section name -> (JSON field, paragraph marker); names are kept
+# as bytes so scanned markers are dispatched without decoding them
+_QUEST_SECTIONS = {
+    b'PROLOGUE': ('prologue', 'PROLOGUE_PARAGRAPH'),
+    b'DESCRIPTION_LORE': ('description_lore', 'LORE_PARAGRAPH'),
+    b'EPILOGUE': ('epilogue', 'EPILOGUE_PARAGRAPH'),
+}
+
+# Quest fields holding lore
+_LORE_FIELDS = frozenset(('prologue', 'description_lore', 'epilogue'))
+
+
+def _compile_paragraph_patterns(paragraph_marker: str) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Compile the (head, terminator) bytes patterns for a paragraph marker.
+    
+    The head matches a paragraph's marker line. The terminator matches the
+    blank line followed by a separator, another paragraph marker or a section
+    marker that ends a paragraph's text.
+    """
+    marker = re.escape(paragraph_marker.encode('ascii'))
+    return (
+        re.compile(rb'<!-- ' + marker + rb' index=(\d+) -->\n'),
+        re.compile(rb'\n\n(?:---|<!-- (?:' + marker + rb'|(?:PROLOGUE|DESCRIPTION_LORE|EPILOGUE|LORE_ENTRY)_(?:START|END)))')
+    )
+
+
+# Paragraph patterns by marker; the markers used in lore files are compiled
+# at import time, others on first use
+_PARAGRAPH_RE_CACHE: Dict[str, Tuple[re.Pattern, re.Pattern]] = {
+    paragraph_marker: _compile_paragraph_patterns(paragraph_marker)
+    for _, paragraph_marker in _QUEST_SECTIONS.values()
+}
+
+
+def _paragraph_patterns(paragraph_marker: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Return the compiled (head, terminator) patterns for a paragraph marker."""
+    patterns = _PARAGRAPH_RE_CACHE.get(paragraph_marker)
+    if patterns is None:
+        patterns = _PARAGRAPH_RE_CACHE[paragraph_marker] = _compile_paragraph_patterns(paragraph_marker)
+    return patterns
+
+
+# Sidecar next to each quests.json recording the lore file it was last synced with
+_CACHE_FILE_NAME = '.lore_cache.json'
+
+
+def _lore_hash(content: bytes) -> str:
+    """Return the digest identifying a lore markdown file's content."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _map_lore_file(lore_file: Path):
+    """
+    Memory-map a lore markdown file for reading.
+    
+    Returns:
+        A context manager yielding the read-only mmap, or b'' for an empty
+        file, which cannot be mapped
+    """
+    with open(lore_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return nullcontext(b'')
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _read_sync_cache(json_path: Path, lore_hash: str) -> Optional[Tuple[int, int]]:
+    """
+    Check whether a quests.json is already in sync with a lore file.
+    
+    Args:
+        json_path: Path to the quests.json file
+        lore_hash: Digest of the current lore markdown content
+        
+    Returns:
+        Tuple of (added_count, removed_count) recorded by the last run if neither
+        the lore content nor the quests.json changed since, otherwise None
+    """
+    try:
+        with open(json_path.parent / _CACHE_FILE_NAME, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        json_stat = os.stat(json_path)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cache, dict):
+        return None
+    if (cache.get('lore_hash') != lore_hash or cache.get('json_mtime_ns') != json_stat.st_mtime_ns
+            or cache.get('json_size') != json_stat.st_size):
+        return None
+    
+    return (cache.get('added', 0), cache.get('removed', 0))
+
+
+def _write_sync_cache(json_path: Path, lore_hash: str, added_count: int, removed_count: int) -> None:
+    """Record that a quests.json is in sync with the lore content hashed as lore_hash."""
+    try:
+        json_stat = os.stat(json_path)
+        with open(json_path.parent / _CACHE_FILE_NAME, 'w', encoding='utf-8') as f:
+            json.dump({
+                'lore_hash': lore_hash,
+                'json_mtime_ns': json_stat.st_mtime_ns,
+                'json_size': json_stat.st_size,
+                'added': added_count,
+                'removed': removed_count,
+            }, f)
+    except OSError as e:
+        print(f"WARNING: Failed to write {_CACHE_FILE_NAME} for {json_path}: {e}", file=sys.stderr)
+
+
+@dataclass
+class QuestLore:
+    """
+    Lore sections of one quest parsed from markdown.
+    
+    A section missing from the markdown is None; a section without
+    paragraphs is an empty list.
+    """
+    __slots__ = ('prologue', 'description_lore', 'epilogue')
+    prologue: Optional[List[str]]
+    description_lore: Optional[List[str]]
+    epilogue: Optional[List[str]]
+    
+    def is_empty(self) -> bool:
+        return self.prologue is None and self.description_lore is None and self.epilogue is None
+
+
+def parse_lore_markdown(markdown_path: Path, content: Optional[bytes] = None) -> Tuple[Optional[List[str]], Optional[List[str]], Dict[int, QuestLore]]:
     """
     Parse a lore markdown file and extract meta-level and quest-level lore entries.
     
@@ -46,97 +195,153 @@ def parse_lore_markdown(markdown_path: Path) -> Tuple[Optional[List[str]], Optio
     
     Args:
         markdown_path: Path to the lore markdown file
+        content: Raw content of the file (bytes or an mmap); read from markdown_path if None
         
     Returns:
         Tuple of (meta_prologue, meta_epilogue, quest_lore_dict)
         - meta_prologue: List of prologue paragraphs or None
         - meta_epilogue: List of epilogue paragraphs or None
-        - quest_lore_dict: Dictionary mapping quest_id to dict with 'prologue', 'description_lore', 'epilogue' keys
+        - quest_lore_dict: Dictionary mapping quest_id to its QuestLore
     """
-    try:
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"ERROR: Failed to read {markdown_path}: {e}", file=sys.stderr)
-        return (None, None, {})
+    if content is None:
+        try:
+            with open(markdown_path, 'rb') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"ERROR: Failed to read {markdown_path}: {e}", file=sys.stderr)
+            return (None, None, {})
     
-    # Extract meta-level prologue
-    meta_prologue = None
-    meta_prologue_match = re.search(r'<!-- META_PROLOGUE_START -->(.*?)<!-- META_PROLOGUE_END -->', content, re.DOTALL)
-    if meta_prologue_match:
-        meta_prologue = extract_paragraphs(meta_prologue_match.group(1), 'PROLOGUE_PARAGRAPH')
+    # Markers are matched on the raw bytes and only paragraph text is decoded.
+    # Line endings are normalized the way text mode would.
+    if content.find(b'\r') != -1:
+        content = content[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     
-    # Extract meta-level epilogue
+    meta_prologue = None
     meta_epilogue = None
-    meta_epilogue_match = re.search(r'<!-- META_EPILOGUE_START -->(.*?)<!-- META_EPILOGUE_END -->', content, re.DOTALL)
-    if meta_epilogue_match:
-        meta_epilogue = extract_paragraphs(meta_epilogue_match.group(1), 'EPILOGUE_PARAGRAPH')
-    
-    # Extract quest-level lore entries
     quest_lore_dict = {}
-    entry_pattern = r'<!-- LORE_ENTRY_START quest_id=(\d+) -->.*?<!-- LORE_ENTRY_END quest_id=\1 -->'
     
-    for entry_match in re.finditer(entry_pattern, content, re.DOTALL):
-        quest_id = int(entry_match.group(1))
-        entry_content = entry_match.group(0)
-        
-        quest_lore = {}
-        
-        # Extract prologue section
-        prologue_match = re.search(r'<!-- PROLOGUE_START -->(.*?)<!-- PROLOGUE_END -->', entry_content, re.DOTALL)
-        if prologue_match:
-            quest_lore['prologue'] = extract_paragraphs(prologue_match.group(1), 'PROLOGUE_PARAGRAPH')
-        
-        # Extract description_lore section
-        desc_match = re.search(r'<!-- DESCRIPTION_LORE_START -->(.*?)<!-- DESCRIPTION_LORE_END -->', entry_content, re.DOTALL)
-        if desc_match:
-            quest_lore['description_lore'] = extract_paragraphs(desc_match.group(1), 'LORE_PARAGRAPH')
-        
-        # Extract epilogue section
-        epilogue_match = re.search(r'<!-- EPILOGUE_START -->(.*?)<!-- EPILOGUE_END -->', entry_content, re.DOTALL)
-        if epilogue_match:
-            quest_lore['epilogue'] = extract_paragraphs(epilogue_match.group(1), 'EPILOGUE_PARAGRAPH')
-        
-        if quest_lore:
-            quest_lore_dict[quest_id] = quest_lore
-        else:
-            print(f"WARNING: Quest {quest_id} in {markdown_path.name} has no lore sections", file=sys.stderr)
+    # Single pass over all section markers. open_sections maps a section
+    # name to the offset where its content starts; quest-level sections are
+    # only collected while a LORE_ENTRY is open. As before, the first
+    # occurrence of a section wins.
+    open_sections = {}
+    entry_id = None
+    quest_lore = None
+    
+    # Paragraph text is decoded per slice, so invalid UTF-8 surfaces here;
+    # the whole file is then decoded to report the error's file position
+    try:
+        for marker_match in _SECTION_MARKER_RE.finditer(content):
+            name, edge, marker_quest_id = marker_match.groups()
+            
+            # Only entry markers carry a quest id
+            if (name == b'LORE_ENTRY') != (marker_quest_id is not None):
+                continue
+            
+            if name == b'LORE_ENTRY':
+                if edge == b'START':
+                    # Entries do not nest, a START inside an open entry is ignored.
+                    # An entry is only opened if its END follows, so a lost END
+                    # marker skips that one entry instead of all later ones.
+                    if entry_id is None:
+                        if content.find(b'<!-- LORE_ENTRY_END quest_id=' + marker_quest_id + b' -->', marker_match.end()) == -1:
+                            print(f"WARNING: Quest {int(marker_quest_id)} in {markdown_path.name} has no LORE_ENTRY_END marker, skipping it", file=sys.stderr)
+                            continue
+                        entry_id = int(marker_quest_id)
+                        quest_lore = QuestLore(None, None, None)
+                        for section in _QUEST_SECTIONS:
+                            open_sections.pop(section, None)
+                elif entry_id is not None and int(marker_quest_id) == entry_id:
+                    if not quest_lore.is_empty():
+                        quest_lore_dict[entry_id] = quest_lore
+                    else:
+                        print(f"WARNING: Quest {entry_id} in {markdown_path.name} has no lore sections", file=sys.stderr)
+                    entry_id = None
+                continue
+            
+            if edge == b'START':
+                open_sections.setdefault(name, marker_match.end())
+                continue
+            
+            start = open_sections.pop(name, None)
+            if start is None:
+                continue
+            section_content = content[start:marker_match.start()]
+            
+            if name == b'META_PROLOGUE':
+                if meta_prologue is None:
+                    meta_prologue = extract_paragraphs(section_content, 'PROLOGUE_PARAGRAPH')
+            elif name == b'META_EPILOGUE':
+                if meta_epilogue is None:
+                    meta_epilogue = extract_paragraphs(section_content, 'EPILOGUE_PARAGRAPH')
+            elif entry_id is not None:
+                field, paragraph_marker = _QUEST_SECTIONS[name]
+                if getattr(quest_lore, field) is None:
+                    setattr(quest_lore, field, extract_paragraphs(section_content, paragraph_marker))
+    except UnicodeDecodeError as e:
+        try:
+            content[:].decode('utf-8')
+        except UnicodeDecodeError as file_error:
+            e = file_error
+        print(f"ERROR: Failed to read {markdown_path}: {e}", file=sys.stderr)
+        return (None, None, {})
     
     return (meta_prologue, meta_epilogue, quest_lore_dict)
 
 
-def extract_paragraphs(section_content: str, paragraph_marker: str) -> List[str]:
+def extract_paragraphs(section_content: bytes, paragraph_marker: str) -> List[str]:
     """
     Extract paragraphs from a lore section using paragraph markers.
     
     Args:
-        section_content: The content of a lore section
+        section_content: The raw UTF-8 content of a lore section
         paragraph_marker: The marker name (e.g., 'LORE_PARAGRAPH', 'PROLOGUE_PARAGRAPH')
         
     Returns:
         List of paragraph strings in order
+        
+    Raises:
+        UnicodeDecodeError: If a paragraph is not valid UTF-8
     """
-    paragraphs = []
-    paragraph_pattern = rf'<!-- {paragraph_marker} index=(\d+) -->\n(.*?)(?=\n\n<!-- (?:{paragraph_marker}|(?:PROLOGUE|DESCRIPTION_LORE|EPILOGUE|LORE_ENTRY)_(?:START|END))|\n\n---|\Z)'
+    paragraphs_by_index = {}
+    head_re, end_re = _paragraph_patterns(paragraph_marker)
     
-    for para_match in re.finditer(paragraph_pattern, section_content, re.DOTALL):
-        index = int(para_match.group(1))
-        text = para_match.group(2).strip()
+    # A paragraph's text runs from the end of its marker line to the first
+    # terminator after it; marker lines inside that text are not paragraphs
+    text_end = 0
+    for head_match in head_re.finditer(section_content):
+        if head_match.start() < text_end:
+            continue
         
-        # Ensure we have enough slots in the list
-        while len(paragraphs) <= index:
-            paragraphs.append(None)
+        end_match = end_re.search(section_content, head_match.end())
+        text_end = end_match.start() if end_match else len(section_content)
         
-        paragraphs[index] = text
-    
-    # Filter out None values (shouldn't happen with proper markdown)
-    paragraphs = [p for p in paragraphs if p is not None]
+        # A repeated index replaces the earlier paragraph
+        paragraphs_by_index[int(head_match.group(1))] = section_content[head_match.end():text_end].decode('utf-8').strip()
     
-    return paragraphs if paragraphs else []
+    # Order by index; gaps in the numbering are skipped
+    return [paragraphs_by_index[index] for index in sorted(paragraphs_by_index)]
+
+
+# Sentinel for a lore field that is absent from the JSON
+_MISSING = object()
+
+
+def _section_changed(old_paragraphs, new_paragraphs: List[str]) -> bool:
+    """Compare a JSON lore field (or _MISSING) with its markdown paragraphs; absent equals empty."""
+    if old_paragraphs is _MISSING:
+        return len(new_paragraphs) > 0
+    return old_paragraphs != new_paragraphs
+
+
+def _paragraph_count(old_paragraphs) -> int:
+    """Return the paragraph count of a JSON lore field, 0 if it is _MISSING."""
+    return 0 if old_paragraphs is _MISSING else len(old_paragraphs)
 
 
 def update_quest_json(json_path: Path, meta_prologue: Optional[List[str]], meta_epilogue: Optional[List[str]],
-                     quest_lore_dict: Dict[int, Dict[str, List[str]]], dry_run: bool = False) -> Tuple[int, int, int]:
+                     quest_lore_dict: Dict[int, QuestLore], dry_run: bool = False,
+                     lore_hash: Optional[str] = None) -> Tuple[int, int, int]:
     """
     Update a quests.json file with lore entries from markdown.
     
@@ -144,15 +349,17 @@ def update_quest_json(json_path: Path, meta_prologue: Optional[List[str]], meta_
         json_path: Path to the quests.json file
         meta_prologue: Meta-level prologue paragraphs or None
         meta_epilogue: Meta-level epilogue paragraphs or None
-        quest_lore_dict: Dictionary mapping quest_id to dict with 'prologue', 'description_lore', 'epilogue' keys
+        quest_lore_dict: Dictionary mapping quest_id to its QuestLore
         dry_run: If True, show changes without modifying the file
+        lore_hash: Digest of the lore markdown; if given, a successful update
+                   records it so unchanged files can be skipped next time
         
     Returns:
         Tuple of (updated_count, added_count, removed_count)
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        original = json_path.read_bytes()
+        data = orjson.loads(original) if orjson is not None else json.loads(original)
     except json.JSONDecodeError as e:
         print(f"ERROR: Failed to parse JSON in {json_path}: {e}", file=sys.stderr)
         return (0, 0, 0)
@@ -168,70 +375,82 @@ def update_quest_json(json_path: Path, meta_prologue: Optional[List[str]], meta_
     added_count = 0
     removed_count = 0
     
+    # Dry-run messages are collected and printed in one piece
+    report = []
+    
+    # Sections are compared as plain lists: str equality is a memcmp that
+    # stops at the first difference, which hashing both sides cannot beat,
+    # and list comparison returns on a length mismatch before looking at any
+    # element, so an explicit len() check would only add a second test.
+    # Files that did not change at all are skipped earlier via the sync cache.
+    
     # Update meta-level prologue
     if meta_prologue is not None:
-        old_prologue = data.get('prologue', [])
-        if old_prologue != meta_prologue:
+        old_prologue = data.get('prologue', _MISSING)
+        if _section_changed(old_prologue, meta_prologue):
             if dry_run:
-                print(f"  [DRY RUN] Would update meta prologue ({len(old_prologue)} -> {len(meta_prologue)} paragraphs)")
+                report.append(f"  [DRY RUN] Would update meta prologue ({_paragraph_count(old_prologue)} -> {len(meta_prologue)} paragraphs)")
             else:
                 data['prologue'] = meta_prologue
             updated_count += 1
     
     # Update meta-level epilogue
     if meta_epilogue is not None:
-        old_epilogue = data.get('epilogue', [])
-        if old_epilogue != meta_epilogue:
+        old_epilogue = data.get('epilogue', _MISSING)
+        if _section_changed(old_epilogue, meta_epilogue):
             if dry_run:
-                print(f"  [DRY RUN] Would update meta epilogue ({len(old_epilogue)} -> {len(meta_epilogue)} paragraphs)")
+                report.append(f"  [DRY RUN] Would update meta epilogue ({_paragraph_count(old_epilogue)} -> {len(meta_epilogue)} paragraphs)")
             else:
                 data['epilogue'] = meta_epilogue
             updated_count += 1
     
-    # Create a map of quest_id to quest object for easy lookup
-    quest_map = {quest.get('id'): quest for quest in data['quests'] if 'id' in quest}
-    
-    # Track which quest IDs we've seen in the markdown
-    markdown_quest_ids = set(quest_lore_dict.keys())
-    json_quest_ids = set(quest_map.keys())
+    # Create a map of quest_id to quest object for easy lookup. Field names
+    # are looked up with the literal keys as they are: both JSON decoders
+    # already share one key object across quests, and re-keying every quest
+    # with interned names costs several times the lookups it would speed up
+    quest_map = {quest['id']: quest for quest in data['quests'] if 'id' in quest}
     
     # Update existing quests
     for quest_id, new_lore_sections in quest_lore_dict.items():
-        if quest_id in quest_map:
-            quest = quest_map[quest_id]
+        quest = quest_map.get(quest_id)
+        if quest is not None:
             quest_updated = False
+            title = quest.get('title', 'Untitled') if dry_run else None
             
             # Update prologue if present in markdown
-            if 'prologue' in new_lore_sections:
-                old_prologue = quest.get('prologue', [])
-                if old_prologue != new_lore_sections['prologue']:
+            new_prologue = new_lore_sections.prologue
+            if new_prologue is not None:
+                old_prologue = quest.get('prologue', _MISSING)
+                if _section_changed(old_prologue, new_prologue):
                     if dry_run:
-                        print(f"  [DRY RUN] Would update Quest {quest_id} prologue: {quest.get('title', 'Untitled')}")
-                        print(f"    Old paragraphs: {len(old_prologue)}, New paragraphs: {len(new_lore_sections['prologue'])}")
+                        report.append(f"  [DRY RUN] Would update Quest {quest_id} prologue: {title}")
+                        report.append(f"    Old paragraphs: {_paragraph_count(old_prologue)}, New paragraphs: {len(new_prologue)}")
                     else:
-                        quest['prologue'] = new_lore_sections['prologue']
+                        quest['prologue'] = new_prologue
                     quest_updated = True
             
             # Update description_lore if present in markdown
-            if 'description_lore' in new_lore_sections:
-                old_lore = quest.get('description_lore', [])
-                if old_lore != new_lore_sections['description_lore']:
+            new_description_lore = new_lore_sections.description_lore
+            if new_description_lore is not None:
+                old_lore = quest.get('description_lore', _MISSING)
+                if _section_changed(old_lore, new_description_lore):
                     if dry_run:
-                        print(f"  [DRY RUN] Would update Quest {quest_id} description_lore: {quest.get('title', 'Untitled')}")
-                        print(f"    Old paragraphs: {len(old_lore)}, New paragraphs: {len(new_lore_sections['description_lore'])}")
+                        report.append(f"  [DRY RUN] Would update Quest {quest_id} description_lore: {title}")
+                        report.append(f"    Old paragraphs: {_paragraph_count(old_lore)}, New paragraphs: {len(new_description_lore)}")
                     else:
-                        quest['description_lore'] = new_lore_sections['description_lore']
+                        quest['description_lore'] = new_description_lore
                     quest_updated = True
             
             # Update epilogue if present in markdown
-            if 'epilogue' in new_lore_sections:
-                old_epilogue = quest.get('epilogue', [])
-                if old_epilogue != new_lore_sections['epilogue']:
+            new_epilogue = new_lore_sections.epilogue
+            if new_epilogue is not None:
+                old_epilogue = quest.get('epilogue', _MISSING)
+                if _section_changed(old_epilogue, new_epilogue):
                     if dry_run:
-                        print(f"  [DRY RUN] Would update Quest {quest_id} epilogue: {quest.get('title', 'Untitled')}")
-                        print(f"    Old paragraphs: {len(old_epilogue)}, New paragraphs: {len(new_lore_sections['epilogue'])}")
+                        report.append(f"  [DRY RUN] Would update Quest {quest_id} epilogue: {title}")
+                        report.append(f"    Old paragraphs: {_paragraph_count(old_epilogue)}, New paragraphs: {len(new_epilogue)}")
                     else:
-                        quest['epilogue'] = new_lore_sections['epilogue']
+                        quest['epilogue'] = new_epilogue
                     quest_updated = True
             
             if quest_updated:
@@ -239,32 +458,115 @@ def update_quest_json(json_path: Path, meta_prologue: Optional[List[str]], meta_
         else:
             # Quest ID in markdown but not in JSON - this is unusual
             if dry_run:
-                print(f"  [DRY RUN] Would add new Quest {quest_id} (found in markdown but not in JSON)")
+                report.append(f"  [DRY RUN] Would add new Quest {quest_id} (found in markdown but not in JSON)")
             added_count += 1
     
     # Check for quests removed from markdown
-    for quest_id in json_quest_ids:
-        if quest_id not in markdown_quest_ids:
-            quest = quest_map[quest_id]
-            has_lore = any(field in quest for field in ['prologue', 'description_lore', 'epilogue'])
-            if has_lore:
-                if dry_run:
-                    print(f"  [DRY RUN] Quest {quest_id} has lore in JSON but not in markdown (would keep existing)")
-                removed_count += 1
-    
-    # Write updated JSON back to file
+    for quest_id, quest in quest_map.items():
+        if quest_id not in quest_lore_dict and not _LORE_FIELDS.isdisjoint(quest):
+            if dry_run:
+                report.append(f"  [DRY RUN] Quest {quest_id} has lore in JSON but not in markdown (would keep existing)")
+            removed_count += 1
+    
+    if report:
+        print('\n'.join(report))
+    
+    # Write updated JSON back to file; serialize once and replace the file
+    # atomically so an interrupted run never leaves a truncated quests.json.
+    # A symlinked quests.json is replaced at its target, and the new file
+    # keeps the permissions of the one it replaces.
     if not dry_run and updated_count > 0:
+        target_path = json_path.resolve()
+        tmp_path = None
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.write('\n')  # Add trailing newline
+            if orjson is not None:
+                serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            else:
+                serialized = (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')  # Add trailing newline
+            with tempfile.NamedTemporaryFile(dir=target_path.parent, prefix=f'.{target_path.name}.',
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = Path(f.name)
+                f.write(serialized)
+            shutil.copymode(target_path, tmp_path)
+            os.replace(tmp_path, target_path)
         except Exception as e:
             print(f"ERROR: Failed to write {json_path}: {e}", file=sys.stderr)
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             return (0, 0, 0)
     
+    if not dry_run and lore_hash is not None:
+        _write_sync_cache(json_path, lore_hash, added_count, removed_count)
+    
     return (updated_count, added_count, removed_count)
 
 
+def _process_lore_file(lore_file: Path, json_file: Path, genre: str, dry_run: bool) -> Tuple[int, int, int]:
+    """
+    Sync one lore markdown file into the quests.json next to it.
+    
+    Args:
+        lore_file: Path to a lore-{genre}.md file
+        json_file: Path to the quests.json of the same genre
+        genre: Genre name taken from the lore file name
+        dry_run: If True, show changes without modifying files
+        
+    Returns:
+        Tuple of (updated_count, added_count, removed_count)
+    """
+    print(f"Processing {genre}...")
+    
+    # Check the corresponding quests.json file before reading the lore
+    if not json_file.exists():
+        print(f"✗ quests.json not found at {json_file}\n")
+        return (0, 0, 0)
+    
+    try:
+        mapped = _map_lore_file(lore_file)
+    except Exception as e:
+        print(f"ERROR: Failed to read {lore_file}: {e}", file=sys.stderr)
+        print(f"✗ Skipping {genre}\n")
+        return (0, 0, 0)
+    
+    with mapped as content:
+        # Skip files whose lore and quests.json are unchanged since the last sync
+        lore_hash = _lore_hash(content)
+        if not dry_run:
+            cached = _read_sync_cache(json_file, lore_hash)
+            if cached is not None:
+                print(f"  No changes since last run\n")
+                return (0, cached[0], cached[1])
+        
+        # Parse the markdown file
+        meta_prologue, meta_epilogue, quest_lore_dict = parse_lore_markdown(lore_file, content)
+    
+    if not quest_lore_dict and not meta_prologue and not meta_epilogue:
+        print(f"⚠ No lore entries found in {lore_file.name}\n")
+        return (0, 0, 0)
+    
+    if quest_lore_dict:
+        print(f"  Parsed {len(quest_lore_dict)} quest lore entries from markdown")
+    if meta_prologue:
+        print(f"  Parsed meta prologue with {len(meta_prologue)} paragraph(s)")
+    if meta_epilogue:
+        print(f"  Parsed meta epilogue with {len(meta_epilogue)} paragraph(s)")
+    
+    # Update the JSON file
+    updated, added, removed = update_quest_json(json_file, meta_prologue, meta_epilogue, quest_lore_dict, dry_run, lore_hash)
+    
+    if dry_run:
+        if updated > 0 or added > 0 or removed > 0:
+            print(f"  Would update: {updated}, add: {added}, remove: {removed}")
+    else:
+        if updated > 0:
+            print(f"✓ Updated {updated} quest(s) in {json_file.name}")
+        else:
+            print(f"  No changes needed")
+    
+    print()
+    return (updated, added, removed)
+
+
 def main():
     """
     Main function to process all lore markdown files.
@@ -291,7 +593,7 @@ def main():
         sys.exit(1)
     
     # Find all lore-{genre}.md files
-    lore_files = list(quests_base_dir.glob('*/lore-*.md'))
+    lore_files = find_lore_files(quests_base_dir)
     
     if not lore_files:
         print(f"WARNING: No lore markdown files found in {quests_base_dir}", file=sys.stderr)
@@ -302,55 +604,28 @@ def main():
         print("DRY RUN MODE - No files will be modified\n")
     print()
     
-    # Process each lore file
+    # Process each lore file; genres are independent, so large sets are
+    # processed in parallel with each report printed in file order
     total_updated = 0
     total_added = 0
     total_removed = 0
     
-    for lore_file in sorted(lore_files):
-        # Extract genre from filename (lore-{genre}.md)
-        genre = lore_file.stem.replace('lore-', '')
-        
-        print(f"Processing {genre}...")
-        
-        # Parse the markdown file
-        meta_prologue, meta_epilogue, quest_lore_dict = parse_lore_markdown(lore_file)
-        
-        if not quest_lore_dict and not meta_prologue and not meta_epilogue:
-            print(f"⚠ No lore entries found in {lore_file.name}\n")
-            continue
-        
-        if quest_lore_dict:
-            print(f"  Parsed {len(quest_lore_dict)} quest lore entries from markdown")
-        if meta_prologue:
-            print(f"  Parsed meta prologue with {len(meta_prologue)} paragraph(s)")
-        if meta_epilogue:
-            print(f"  Parsed meta epilogue with {len(meta_epilogue)} paragraph(s)")
-        
-        # Find corresponding quests.json file
-        json_file = lore_file.parent / 'quests.json'
-        
-        if not json_file.exists():
-            print(f"✗ quests.json not found at {json_file}\n")
-            continue
-        
-        # Update the JSON file
-        updated, added, removed = update_quest_json(json_file, meta_prologue, meta_epilogue, quest_lore_dict, args.dry_run)
+    if not worth_parallelizing(path for lore_file, json_file, _ in lore_files for path in (lore_file, json_file)):
+        results = [_process_lore_file(lore_file, json_file, genre, args.dry_run) for lore_file, json_file, genre in lore_files]
+    else:
+        # Imported here, as multiprocessing is slow to load for small runs
+        from concurrent.futures import ProcessPoolExecutor
         
+        results = []
+        with ProcessPoolExecutor() as executor:
+            for output, counts in executor.map(partial(run_captured, _process_lore_file, dry_run=args.dry_run), *zip(*lore_files)):
+                replay_output(output)
+                results.append(counts)
+    
+    for updated, added, removed in results:
         total_updated += updated
         total_added += added
         total_removed += removed
-        
-        if args.dry_run:
-            if updated > 0 or added > 0 or removed > 0:
-                print(f"  Would update: {updated}, add: {added}, remove: {removed}")
-        else:
-            if updated > 0:
-                print(f"✓ Updated {updated} quest(s) in {json_file.name}")
-            else:
-                print(f"  No changes needed")
-        
-        print()
     
     # Summary
     if args.dry_run: